@@ -14,6 +14,23 @@ resources = {
     "8kozm6": "/presigned-url"
 }
 
+# CORS header parameters are identical for every resource, so serialize them once
+method_response_params = json.dumps({
+    "method.response.header.Access-Control-Allow-Origin": False,
+    "method.response.header.Access-Control-Allow-Methods": False,
+    "method.response.header.Access-Control-Allow-Headers": False,
+    "method.response.header.Access-Control-Max-Age": False,
+    "method.response.header.Access-Control-Allow-Credentials": False
+})
+
+integration_response_params = json.dumps({
+    "method.response.header.Access-Control-Allow-Origin": "'*'",
+    "method.response.header.Access-Control-Allow-Methods": "'GET,POST,PUT,DELETE,OPTIONS'",
+    "method.response.header.Access-Control-Allow-Headers": "'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'",
+    "method.response.header.Access-Control-Max-Age": "'86400'",
+    "method.response.header.Access-Control-Allow-Credentials": "'true'"
+})
+
 def configure_cors_for_resource(resource_id, resource_path):
     print(f"\nConfiguring CORS for {resource_path} (resource: {resource_id})...")
     
@@ -47,14 +64,6 @@ def configure_cors_for_resource(resource_id, resource_path):
         print(f"  ℹ Integration may already exist")
     
     # Put method response
-    method_response_params = {
-        "method.response.header.Access-Control-Allow-Origin": False,
-        "method.response.header.Access-Control-Allow-Methods": False,
-        "method.response.header.Access-Control-Allow-Headers": False,
-        "method.response.header.Access-Control-Max-Age": False,
-        "method.response.header.Access-Control-Allow-Credentials": False
-    }
-    
     try:
         subprocess.run([
             "aws", "apigateway", "put-method-response",
@@ -62,7 +71,7 @@ def configure_cors_for_resource(resource_id, resource_path):
             "--resource-id", resource_id,
             "--http-method", "OPTIONS",
             "--status-code", "200",
-            "--response-parameters", json.dumps(method_response_params),
+            "--response-parameters", method_response_params,
             "--response-models", '{"application/json":"Empty"}',
             "--region", region
         ], check=True, capture_output=True)
@@ -71,14 +80,6 @@ def configure_cors_for_resource(resource_id, resource_path):
         print(f"  ℹ Method response may already exist")
     
     # Put integration response
-    integration_response_params = {
-        "method.response.header.Access-Control-Allow-Origin": "'*'",
-        "method.response.header.Access-Control-Allow-Methods": "'GET,POST,PUT,DELETE,OPTIONS'",
-        "method.response.header.Access-Control-Allow-Headers": "'Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token'",
-        "method.response.header.Access-Control-Max-Age": "'86400'",
-        "method.response.header.Access-Control-Allow-Credentials": "'true'"
-    }
-    
     try:
         subprocess.run([
             "aws", "apigateway", "put-integration-response",
@@ -86,7 +87,7 @@ def configure_cors_for_resource(resource_id, resource_path):
             "--resource-id", resource_id,
             "--http-method", "OPTIONS",
             "--status-code", "200",
-            "--response-parameters", json.dumps(integration_response_params),
+            "--response-parameters", integration_response_params,
             "--region", region
         ], check=True, capture_output=True)
         print(f"  ✓ Integration response configured")
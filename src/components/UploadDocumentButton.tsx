@@ -19,6 +19,8 @@ import { AWS_CONFIG } from '@/lib/aws-config';
 import { useIsMobile } from '@/hooks/use-mobile';
 
 
+const knowledgeBaseManager = new KnowledgeBaseManager(AWS_CONFIG.endpoints.pharmaApiGateway);
+
 interface UploadDocumentButtonProps {
   onUploadSuccess?: () => void;
   className?: string;
@@ -42,8 +44,6 @@ const UploadDocumentButton: React.FC<UploadDocumentButtonProps> = ({
   const [success, setSuccess] = useState<string | null>(null);
   const isMobile = useIsMobile();
 
-  const knowledgeBaseManager = new KnowledgeBaseManager(AWS_CONFIG.endpoints.pharmaApiGateway);
-
   // No WebSocket needed
   const isConnected = true;
   /*
@@ -47,13 +47,18 @@ export const useWebSocket = (options: UseWebSocketOptions = {}) => {
       ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
-          console.log('WebSocket message received:', data);
+          // Per-message tracing only in dev builds - progress updates arrive continuously
+          if (import.meta.env.DEV) {
+            console.log('WebSocket message received:', data);
+          }
 
           if (data.type === 'connection') {
             setConnectionId(data.connectionId);
           } else if (data.action === 'progressUpdate') {
             // Handle progress updates from document processing
-            console.log(`Progress update: ${data.data?.progress}% - ${data.message}`);
+            if (import.meta.env.DEV) {
+              console.log(`Progress update: ${data.data?.progress}% - ${data.message}`);
+            }
             setProgress(prev => [...prev, {
               type: 'progress',
               step: data.step,
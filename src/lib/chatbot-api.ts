@@ -94,6 +94,7 @@ export interface OrderStatus {
 }
 
 import axios from 'axios';
+import { AWS_CONFIG } from '@/lib/aws-config';
 
 export interface WebSocketMessage {
   type: 'typing' | 'response' | 'error' | 'progress';
@@ -120,16 +121,18 @@ export class ChatbotAPI {
 
   constructor(websocketUrl: string, apiBaseUrl?: string) {
     this.websocketUrl = websocketUrl;
-    this.apiBaseUrl = apiBaseUrl || 'https://api-gateway-production-c4c3.up.railway.app';
+    // Fall back to the endpoint resolved once from the environment in aws-config
+    this.apiBaseUrl = apiBaseUrl || AWS_CONFIG.endpoints.apiGateway;
   }
 
   async createChatSession(): Promise<ChatSession> {
     // Generate a session ID on the frontend
     const sessionId = `session_${Date.now()}_${Math.random().toString(36).substr(2, 9)}`;
+    const now = new Date().toISOString();
     return {
       id: sessionId,
-      createdAt: new Date().toISOString(),
-      updatedAt: new Date().toISOString()
+      createdAt: now,
+      updatedAt: now
     };
   }
 
@@ -221,8 +224,10 @@ export class ChatbotAPI {
         break;
 
       case 'progress':
-        // Handle progress updates
-        console.log('Progress update:', data.message, data.phase, data.status);
+        // Handle progress updates - these arrive continuously, so only trace them in dev builds
+        if (import.meta.env.DEV) {
+          console.log('Progress update:', data.message, data.phase, data.status);
+        }
         this.progressHandlers.forEach(handler => handler(data));
         break;
 
@@ -241,7 +246,9 @@ export class ChatbotAPI {
 
       case 'typing':
         // Handle typing indicator if needed
-        console.log('Bot is typing...');
+        if (import.meta.env.DEV) {
+          console.log('Bot is typing...');
+        }
         break;
     }
   }
@@ -439,7 +446,10 @@ export class ChatbotAPI {
 
       const response = await axios.post(`${apiGatewayUrl}/api/v1/chat`, payload);
 
-      console.log('RAG API Response:', response.data);
+      // Full response dumps are for local debugging only - keep them out of production consoles
+      if (import.meta.env.DEV) {
+        console.log('RAG API Response:', response.data);
+      }
 
       const result = response.data;
 
@@ -456,8 +466,10 @@ export class ChatbotAPI {
         answer = result.response;
       }
 
-      console.log('Parsed Answer:', answer);
-      console.log('Parsed Sources:', sources);
+      if (import.meta.env.DEV) {
+        console.log('Parsed Answer:', answer);
+        console.log('Parsed Sources:', sources);
+      }
 
       const chatResponse: ChatResponse = {
         response: answer,
@@ -469,7 +481,9 @@ export class ChatbotAPI {
       return chatResponse;
     } catch (error: any) {
       console.error('RAG query error:', error);
-      throw new Error(error.response?.data?.error || error.response?.data?.detail?.[0]?.msg || 'Failed to query RAG system');
+      const message = error.response?.data?.error || error.response?.data?.detail?.[0]?.msg || 'Failed to query RAG system';
+      // Keep the HTTP response so retryWithBackoff can see the status code and Retry-After header
+      throw Object.assign(new Error(message), { response: error.response });
     }
   }
 }
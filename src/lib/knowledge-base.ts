@@ -138,6 +138,36 @@ export const getFileExtension = (filename: string): string => {
   return filename.split('.').pop()?.toLowerCase() || '';
 };
 
+// Helpers for getDocuments/checkWebsiteExists - defined once rather than on every call
+
+// Parse size - handles string or number
+const parseSize = (value: number | string | undefined | null): number => {
+  if (value === undefined || value === null) return 0;
+  if (typeof value === 'number') return isNaN(value) ? 0 : value;
+  if (typeof value === 'string') {
+    const parsed = parseInt(value, 10);
+    return isNaN(parsed) ? 0 : parsed;
+  }
+  return 0;
+};
+
+// Extract domain from scraped filename pattern: scraped_{domain}_{tmpfile}.md
+const extractDomainFromScrapedFilename = (filename: string): string | null => {
+  const match = filename.match(/^scraped_([^_]+\.[^_]+)_/i);
+  if (match) {
+    return match[1]; // e.g., "globistaan.com"
+  }
+  return null;
+};
+
+// Normalize URL for comparison (remove trailing slashes, protocol variations)
+export const normalizeUrl = (u: string) => {
+  return u.toLowerCase()
+    .replace(/^https?:\/\//, '')
+    .replace(/\/$/, '')
+    .replace(/^www\./, '');
+};
+
 export class KnowledgeBaseManager {
   private apiBaseUrl: string;
 
@@ -348,25 +378,8 @@ export class KnowledgeBaseManager {
         version?: number;
       }
 
-      // Helper to parse size - handles string or number
-      const parseSize = (value: number | string | undefined | null): number => {
-        if (value === undefined || value === null) return 0;
-        if (typeof value === 'number') return isNaN(value) ? 0 : value;
-        if (typeof value === 'string') {
-          const parsed = parseInt(value, 10);
-          return isNaN(parsed) ? 0 : parsed;
-        }
-        return 0;
-      };
-      
-      // Helper to extract domain from scraped filename pattern: scraped_{domain}_{tmpfile}.md
-      const extractDomainFromScrapedFilename = (filename: string): string | null => {
-        const match = filename.match(/^scraped_([^_]+\.[^_]+)_/i);
-        if (match) {
-          return match[1]; // e.g., "globistaan.com"
-        }
-        return null;
-      };
+      // Fallback timestamp for rows the backend returns without dates - computed once per listing
+      const now = new Date().toISOString();
 
       // Transform response to include proper document information
       const documents: Document[] = (response.data.files || []).map((doc: ResponseDocument) => {
@@ -397,14 +410,7 @@ export class KnowledgeBaseManager {
         // Use database ID as the primary identifier (for download/delete operations)
         // The backend now expects database ID (UUID) for both download and delete endpoints
         const documentId = String(doc.id || doc.key || Math.random().toString());
-        console.log('Document ID assignment:', {
-          id: doc.id,
-          key: doc.key,
-          gemini_file_name: doc.gemini_file_name,
-          name: doc.name,
-          final_documentId: documentId
-        });
-        
+
         return {
           id: documentId, // Database ID (UUID)
           name: name,
@@ -421,8 +427,8 @@ export class KnowledgeBaseManager {
             originalFilename: name,
             fileType: extension
           },
-          createdAt: doc.created_at || new Date().toISOString(),
-          updatedAt: doc.updated_at || doc.last_modified || doc.created_at || new Date().toISOString(),
+          createdAt: doc.created_at || now,
+          updatedAt: doc.updated_at || doc.last_modified || doc.created_at || now,
           source: source,
           originalUrl: originalUrl,
           version: doc.version || 1
@@ -494,10 +500,11 @@ export class KnowledgeBaseManager {
     }
   }
 
-  async checkDocumentExists(filename: string, fileType: string): Promise<Document | null> {
+  async checkDocumentExists(filename: string, fileType: string, documents?: Document[]): Promise<Document | null> {
     try {
-      const response = await this.getDocuments();
-      const existingDoc = response.documents.find(
+      // Reuse a listing the caller already fetched (e.g. once per upload batch) instead of refetching per file
+      const existingDocuments = documents ?? (await this.getDocuments()).documents;
+      const existingDoc = existingDocuments.find(
         doc => doc.name.toLowerCase() === filename.toLowerCase() ||
                (doc.metadata.originalFilename?.toLowerCase() === filename.toLowerCase())
       );
@@ -507,32 +514,30 @@ export class KnowledgeBaseManager {
     }
   }
 
-  async checkWebsiteExists(url: string): Promise<Document | null> {
+  async checkWebsiteExists(url: string, documents?: Document[]): Promise<Document | null> {
     try {
-      const response = await this.getDocuments();
+      // Reuse a listing the caller already fetched (e.g. once per crawl batch) instead of refetching per URL
+      const existingDocuments = documents ?? (await this.getDocuments()).documents;
       console.log('checkWebsiteExists: Looking for URL:', url);
-      console.log('checkWebsiteExists: Found', response.documents.length, 'total documents');
-
-      // Normalize URL for comparison (remove trailing slashes, protocol variations)
-      const normalizeUrl = (u: string) => {
-        return u.toLowerCase()
-          .replace(/^https?:\/\//, '')
-          .replace(/\/$/, '')
-          .replace(/^www\./, '');
-      };
+      console.log('checkWebsiteExists: Found', existingDocuments.length, 'total documents');
 
       const normalizedInput = normalizeUrl(url);
       console.log('checkWebsiteExists: Normalized input URL:', normalizedInput);
 
-      const existingDoc = response.documents.find(doc => {
+      const existingDoc = existingDocuments.find(doc => {
         if (doc.source !== 'website') return false;
         const docUrl = doc.originalUrl;
+        // Per-document tracing only in dev builds - this runs once per row of the listing
         if (!docUrl) {
-          console.log('checkWebsiteExists: No originalUrl for doc:', doc.name, doc.id);
+          if (import.meta.env.DEV) {
+            console.log('checkWebsiteExists: No originalUrl for doc:', doc.name, doc.id);
+          }
           return false;
         }
         const normalizedDocUrl = normalizeUrl(docUrl);
-        console.log('checkWebsiteExists: Comparing with doc URL:', docUrl, '->', normalizedDocUrl);
+        if (import.meta.env.DEV) {
+          console.log('checkWebsiteExists: Comparing with doc URL:', docUrl, '->', normalizedDocUrl);
+        }
         return normalizedDocUrl === normalizedInput;
       });
 
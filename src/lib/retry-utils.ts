@@ -41,11 +41,38 @@ const isRetryableError = (error: any): boolean => {
     return true;
   }
 
+  // 429 Too Many Requests
+  if (error.response?.status === 429) {
+    return true;
+  }
+
   return false;
 };
 
 /**
- * Calculate delay with exponential backoff
+ * Read the server's Retry-After hint (seconds or HTTP date) in milliseconds
+ */
+const getRetryAfterDelay = (error: any): number | null => {
+  const header = error.response?.headers?.['retry-after'];
+  if (!header) {
+    return null;
+  }
+
+  const seconds = Number(header);
+  if (!isNaN(seconds)) {
+    return Math.max(0, seconds * 1000);
+  }
+
+  const date = Date.parse(header);
+  if (!isNaN(date)) {
+    return Math.max(0, date - Date.now());
+  }
+
+  return null;
+};
+
+/**
+ * Calculate delay with exponential backoff and full jitter
  */
 const calculateDelay = (
   attempt: number,
@@ -53,12 +80,19 @@ const calculateDelay = (
   multiplier: number,
   maxDelay: number
 ): number => {
-  const delay = initialDelay * Math.pow(multiplier, attempt - 1);
-  return Math.min(delay, maxDelay);
+  const delay = Math.min(initialDelay * Math.pow(multiplier, attempt - 1), maxDelay);
+  // Full jitter keeps clients that failed together from retrying in lockstep
+  return Math.random() * delay;
 };
 
 /**
  * Retry a function with exponential backoff
+ *
+ * Errors are expected to carry the axios `response` when there is one, so that
+ * status codes can be checked. A Retry-After header on the response replaces the
+ * jittered delay, or ends retrying when it exceeds maxDelay. Browsers only expose
+ * that header cross-origin if the API sends `Access-Control-Expose-Headers:
+ * Retry-After`; without it the plain jittered backoff applies.
  */
 export async function retryWithBackoff<T>(
   fn: () => Promise<T>,
@@ -91,7 +125,13 @@ export async function retryWithBackoff<T>(
 
       // Don't delay after last attempt
       if (attempt < maxAttempts) {
-        const delay = calculateDelay(attempt, initialDelay, backoffMultiplier, maxDelay);
+        // Prefer the server's Retry-After hint when it sends one. If it asks for longer
+        // than maxDelay, an earlier retry would only be rejected again, so give up now.
+        const retryAfter = getRetryAfterDelay(error);
+        if (retryAfter !== null && retryAfter > maxDelay) {
+          return { success: false, error, attempts };
+        }
+        const delay = retryAfter ?? calculateDelay(attempt, initialDelay, backoffMultiplier, maxDelay);
         await new Promise(resolve => setTimeout(resolve, delay));
       }
     }
@@ -71,6 +71,9 @@ interface Message {
   };
 }
 
+// Boilerplate suffix the backend sometimes appends to answers ("... and I can provide more targeted information!")
+const TARGETED_INFO_SUFFIX = /\.\.\.?\s*and\s+I\s+can\s+provide\s+more\s+targeted\s+information[!.]?/gi;
+
 const Chatbot = () => {
   const [messages, setMessages] = useState<Message[]>([]);
   const [newMessage, setNewMessage] = useState('');
@@ -79,7 +82,8 @@ const Chatbot = () => {
   const [attachments, setAttachments] = useState<File[]>([]);
   const [isLoading, setIsLoading] = useState(false);
   const [isConnected, setIsConnected] = useState(false);
-  const [apiClient] = useState(new ChatbotAPI(AWS_CONFIG.endpoints.websocket, AWS_CONFIG.endpoints.apiGateway));
+  // Lazy initializer so the client is constructed once, not on every render
+  const [apiClient] = useState(() => new ChatbotAPI(AWS_CONFIG.endpoints.websocket, AWS_CONFIG.endpoints.apiGateway));
   const [error, setError] = useState<string | null>(null);
   const [retryStatus, setRetryStatus] = useState<string>('');
   const [showScrollToBottom, setShowScrollToBottom] = useState(false);
@@ -248,8 +252,7 @@ const Chatbot = () => {
       // Filter out unwanted text from bot response
       let cleanedResponse = response.response;
       // Remove the "targeted information" message
-      cleanedResponse = cleanedResponse.replace(/\.\.\.?\s*and\s+I\s+can\s+provide\s+more\s+targeted\s+information!?/gi, '');
-      cleanedResponse = cleanedResponse.replace(/\.\.\.?\s*and\s+I\s+can\s+provide\s+more\s+targeted\s+information\.?/gi, '');
+      cleanedResponse = cleanedResponse.replace(TARGETED_INFO_SUFFIX, '');
       cleanedResponse = cleanedResponse.trim();
       
       const botMessage: Message = {
@@ -285,7 +288,8 @@ const Chatbot = () => {
       setRetryStatus('');
     } else {
       console.error('Error sending message:', result.error);
-      setError(result.error?.response?.data?.message || result.error?.message || 'Failed to send message. Please try again.');
+      // queryRAG already turns the response body into the error message
+      setError(result.error?.message || 'Failed to send message. Please try again.');
 
       const errorMessage: Message = {
         id: (Date.now() + 1).toString(),
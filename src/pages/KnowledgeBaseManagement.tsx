@@ -72,6 +72,7 @@ import {
   validateUrl,
   formatFileSize,
   getFileExtension,
+  normalizeUrl,
   VALIDATION,
 } from '@/lib/knowledge-base';
 import { AWS_CONFIG } from '@/lib/aws-config';
@@ -100,6 +101,10 @@ interface ConfirmDialogState {
   cancelText?: string;
 }
 
+const knowledgeBaseManager = new KnowledgeBaseManager(AWS_CONFIG.endpoints.pharmaApiGateway);
+// Number of DELETE requests issued at once during bulk delete
+const BULK_DELETE_CONCURRENCY = 5;
+
 const KnowledgeBaseManagement: React.FC = () => {
   const [documents, setDocuments] = useState<Document[]>([]);
   const [isLoading, setIsLoading] = useState(false);
@@ -193,7 +198,6 @@ const KnowledgeBaseManagement: React.FC = () => {
 
   const { theme } = useTheme();
   const isMobile = useIsMobile();
-  const knowledgeBaseManager = new KnowledgeBaseManager(AWS_CONFIG.endpoints.pharmaApiGateway);
 
   // Quick date filter presets
   const applyDatePreset = (preset: string) => {
@@ -274,7 +278,10 @@ const KnowledgeBaseManagement: React.FC = () => {
       console.log('Loading documents from API...');
       const response = await knowledgeBaseManager.getDocuments();
       console.log('Loaded documents:', response.documents.length, 'total');
-      console.log('Document list:', response.documents.map(d => ({ id: d.id, name: d.name })));
+      // Building the id/name projection walks the whole listing, so only do it in dev builds
+      if (import.meta.env.DEV) {
+        console.log('Document list:', response.documents.map(d => ({ id: d.id, name: d.name })));
+      }
       setDocuments(response.documents);
     } catch (err: any) {
       console.error('Error loading documents:', err);
@@ -339,9 +346,24 @@ const KnowledgeBaseManagement: React.FC = () => {
       setSuccess(`Processing ${totalFiles} files...`);
     }
     
+    // Fetch the current listing once for the duplicate checks of the whole batch
+    const existingDocuments = await knowledgeBaseManager.getDocuments()
+      .then(response => response.documents)
+      .catch(() => [] as Document[]);
+    // Names uploaded earlier in this batch - the prefetched listing does not include them
+    const uploadedNames = new Set<string>();
+
     // Process files sequentially
+    let uploadedCount = 0;
     for (let i = 0; i < fileArray.length; i++) {
-      await processFile(fileArray[i]);
+      if (await processFile(fileArray[i], existingDocuments, uploadedNames)) {
+        uploadedCount++;
+      }
+    }
+
+    // Refresh the document list once for the whole batch rather than after every file
+    if (uploadedCount > 0) {
+      loadDocuments();
     }
     
     // Clear the input to allow re-selecting the same files
@@ -350,18 +372,22 @@ const KnowledgeBaseManagement: React.FC = () => {
     }
   };
 
-  const processFile = async (file: File) => {
+  const processFile = async (
+    file: File,
+    existingDocuments?: Document[],
+    uploadedNames?: Set<string>
+  ): Promise<boolean> => {
     const fileId = `${file.name}-${Date.now()}`;
     
     // Client-side validation
     const validation = validateFile(file);
     if (!validation.valid) {
       setError(validation.error || 'Invalid file');
-      return;
+      return false;
     }
 
       // Check if file with same name already exists
-      const existingDoc = await knowledgeBaseManager.checkDocumentExists(file.name, getFileExtension(file.name));
+      const existingDoc = await knowledgeBaseManager.checkDocumentExists(file.name, getFileExtension(file.name), existingDocuments);
       
       if (existingDoc) {
         // Show confirmation dialog for duplicate file
@@ -373,13 +399,36 @@ const KnowledgeBaseManagement: React.FC = () => {
           newFile: file,
           onConfirm: () => uploadFile(file, fileId, true), // Pass replaceExisting=true
         });
-        return;
+        return false;
+      }
+
+      // Same name as a file uploaded earlier in this batch (e.g. dropped from two folders)
+      const normalizedName = file.name.toLowerCase();
+      if (uploadedNames?.has(normalizedName)) {
+        setConfirmDialog({
+          isOpen: true,
+          title: 'Duplicate File Detected',
+          message: `A file "${file.name}" was already uploaded in this batch. Do you want to upload it again? This will create a new version.`,
+          newFile: file,
+          onConfirm: () => uploadFile(file, fileId, true), // Pass replaceExisting=true
+        });
+        return false;
       }
 
-      await uploadFile(file, fileId, false);
+      // The caller reloads documents once the whole batch is done
+      const uploaded = await uploadFile(file, fileId, false, false);
+      if (uploaded) {
+        uploadedNames?.add(normalizedName);
+      }
+      return uploaded;
   };
 
-  const uploadFile = async (file: File, fileId: string, replaceExisting: boolean = false) => {
+  const uploadFile = async (
+    file: File,
+    fileId: string,
+    replaceExisting: boolean = false,
+    reloadDocuments: boolean = true
+  ): Promise<boolean> => {
     setUploadingFiles(prev => new Map(prev).set(fileId, {
       id: fileId,
       file,
@@ -426,7 +475,10 @@ const KnowledgeBaseManagement: React.FC = () => {
         newMap.delete(fileId);
         return newMap;
       });
-      loadDocuments();
+      if (reloadDocuments) {
+        loadDocuments();
+      }
+      return true;
     } catch (err: any) {
       console.error('Upload error:', err);
       setUploadingFiles(prev => {
@@ -435,6 +487,7 @@ const KnowledgeBaseManagement: React.FC = () => {
         return newMap;
       });
       setError(err.message || `Failed to upload ${file.name}`);
+      return false;
     }
   };
 
@@ -820,6 +873,16 @@ const KnowledgeBaseManagement: React.FC = () => {
     setError(null);
     setSuccess(null);
 
+    // Fetch the current listing once and reuse it for every URL's duplicate check
+    const existingDocuments = await knowledgeBaseManager.getDocuments()
+      .then(response => response.documents)
+      .catch(() => [] as Document[]);
+    if (documents.length === 0 && existingDocuments.length > 0) {
+      setDocuments(existingDocuments);
+    }
+    // Normalized URLs crawled earlier in this batch - the prefetched listing does not include them
+    const crawledUrls = new Set<string>();
+
     // Process URLs sequentially - one after another, only starting next when previous succeeds
     const results: Array<{ url: string; success: boolean; error?: string }> = [];
     
@@ -833,22 +896,19 @@ const KnowledgeBaseManagement: React.FC = () => {
       ));
 
       try {
-        // First ensure documents are loaded
-        if (documents.length === 0) {
-          console.log('No documents loaded, fetching documents first...');
-          await loadDocuments();
-        }
-
         // Check if website already exists BEFORE attempting to scrape
-        let existingWebsite = await knowledgeBaseManager.checkWebsiteExists(fullUrl);
+        let existingWebsite = await knowledgeBaseManager.checkWebsiteExists(fullUrl, existingDocuments);
+        const crawledInBatch = crawledUrls.has(normalizeUrl(fullUrl));
 
-        if (existingWebsite) {
+        if (existingWebsite || crawledInBatch) {
           // Website exists - show confirmation dialog BEFORE scraping
           return new Promise((resolve) => {
             setConfirmDialog({
               isOpen: true,
               title: 'Website Already Exists',
-              message: `The website "${fullUrl}" has already been scraped (Version ${existingWebsite.version || 1}). Would you like to re-crawl it and create a new version?`,
+              message: existingWebsite
+                ? `The website "${fullUrl}" has already been scraped (Version ${existingWebsite.version || 1}). Would you like to re-crawl it and create a new version?`
+                : `The website "${fullUrl}" was already crawled in this batch. Would you like to re-crawl it and create a new version?`,
               onConfirm: async () => {
                 try {
                   // Update status to show rescraping
@@ -977,6 +1037,9 @@ const KnowledgeBaseManagement: React.FC = () => {
     for (const entry of validUrls) {
       const result = await processSingleUrl(entry);
       results.push(result);
+      if (result.success) {
+        crawledUrls.add(normalizeUrl(result.url));
+      }
       
       // Only continue to next URL if current one succeeded
       if (!result.success) {
@@ -1069,17 +1132,27 @@ const KnowledgeBaseManagement: React.FC = () => {
     setIsDeleting(true);
     setError(null);
     
+    // Deletes are independent of each other, so issue them concurrently in small
+    // chunks rather than all at once to avoid flooding the API
+    const docIds = Array.from(selectedDocIds);
+
     let successCount = 0;
     let failCount = 0;
 
-    for (const docId of selectedDocIds) {
-      try {
-        await knowledgeBaseManager.deleteDocument(docId);
-        successCount++;
-      } catch (err) {
-        console.error(`Failed to delete ${docId}:`, err);
-        failCount++;
-      }
+    for (let i = 0; i < docIds.length; i += BULK_DELETE_CONCURRENCY) {
+      const chunk = docIds.slice(i, i + BULK_DELETE_CONCURRENCY);
+      const results = await Promise.allSettled(
+        chunk.map(docId => knowledgeBaseManager.deleteDocument(docId))
+      );
+
+      results.forEach((result, index) => {
+        if (result.status === 'fulfilled') {
+          successCount++;
+        } else {
+          console.error(`Failed to delete ${chunk[index]}:`, result.reason);
+          failCount++;
+        }
+      });
     }
 
     setIsDeleting(false);